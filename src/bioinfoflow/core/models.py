@@ -6,17 +6,22 @@ of a BioinfoFlow workflow.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 import enum
 
-class StepStatus(enum.Enum):
-    """Represents the current status of a workflow step."""
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    SKIPPED = "skipped"
+class StepStatus(enum.IntEnum):
+    """Represents the current status of a workflow step.
+
+    An IntEnum so status checks on the scheduler hot path compare as
+    plain ints; use the ``name`` (lowercased) when displaying a status.
+    """
+    PENDING = 0
+    RUNNING = 1
+    COMPLETED = 2
+    FAILED = 3
+    SKIPPED = 4
 
 class InputType(enum.Enum):
     """Type of workflow input."""
@@ -54,6 +59,12 @@ class OutputConfig:
     path: str
     type: str = "file"
     description: Optional[str] = None
+    # Whether path still contains ${...} references; computed once here so
+    # the resolvers branch on an attribute instead of rescanning the string
+    has_variables: bool = field(init=False)
+
+    def __post_init__(self):
+        self.has_variables = "${" in self.path
 
 @dataclass
 class Step:
@@ -68,6 +79,21 @@ class Step:
     foreach: Optional[str] = None  # For sample iteration
     status: StepStatus = StepStatus.PENDING
 
+    # Views consumed by every VariableContext built over this step; cached
+    # lazily. dataclasses.replace returns a fresh instance with an empty
+    # cache, but deepcopy carries cached values along — code that rewrites
+    # outputs in place on a copy must pop "output_paths" from __dict__.
+
+    @cached_property
+    def resources_dict(self) -> Dict[str, Any]:
+        """Resource fields as a plain dict."""
+        return self.resources.__dict__
+
+    @cached_property
+    def output_paths(self) -> Dict[str, str]:
+        """Output name -> path mapping."""
+        return {name: output.path for name, output in self.outputs.items()}
+
 @dataclass
 class WorkflowConfig:
     """Global workflow configuration."""
@@ -6,42 +6,79 @@ managing state, resources, and environment variables.
 """
 
 import os
+import shutil
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from ..core.models import Workflow, Step
+import psutil
+
+from ..core.models import Workflow, Step, StepStatus
 from ..core.exceptions import ExecutionError
 from ..utils.logging import debug, error
 
+try:
+    import torch
+    _HAS_TORCH = True
+except ImportError:
+    _HAS_TORCH = False
+
+# Converts monotonic nanoseconds to wall-clock nanoseconds; captured once
+# so step timestamps cost a single clock read instead of datetime.now()
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+# Unit table for memory strings, built once at import
+_MEMORY_UNITS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024**2,
+    'GB': 1024**3,
+    'TB': 1024**4,
+}
+
 @dataclass
 class StepContext:
     """Context for a single step execution."""
     step: Step
-    status: str = "pending"  # pending, running, completed, failed
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    status: StepStatus = StepStatus.PENDING
+    start_ns: Optional[int] = None
+    end_ns: Optional[int] = None
     exit_code: Optional[int] = None
     error_message: Optional[str] = None
     container_id: Optional[str] = None
     env_vars: Dict[str, str] = field(default_factory=dict)
     
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Wall-clock start time, derived lazily from the monotonic stamp."""
+        if self.start_ns is None:
+            return None
+        return datetime.fromtimestamp((self.start_ns + _EPOCH_OFFSET_NS) / 1e9)
+    
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Wall-clock end time, derived lazily from the monotonic stamp."""
+        if self.end_ns is None:
+            return None
+        return datetime.fromtimestamp((self.end_ns + _EPOCH_OFFSET_NS) / 1e9)
+    
     def mark_running(self) -> None:
         """Mark step as running."""
-        self.status = "running"
-        self.start_time = datetime.now()
+        self.status = StepStatus.RUNNING
+        self.start_ns = time.monotonic_ns()
     
     def mark_completed(self, exit_code: int = 0) -> None:
         """Mark step as completed."""
-        self.status = "completed"
-        self.end_time = datetime.now()
+        self.status = StepStatus.COMPLETED
+        self.end_ns = time.monotonic_ns()
         self.exit_code = exit_code
     
     def mark_failed(self, error_msg: str, exit_code: int = 1) -> None:
         """Mark step as failed."""
-        self.status = "failed"
-        self.end_time = datetime.now()
+        self.status = StepStatus.FAILED
+        self.end_ns = time.monotonic_ns()
         self.exit_code = exit_code
         self.error_message = error_msg
 
@@ -57,6 +94,9 @@ class ExecutionContext:
     - Working directories
     """
     
+    # How long a cached available-memory reading stays fresh (seconds)
+    _MEM_POLL_INTERVAL = 0.5
+    
     def __init__(self, workflow: Workflow, run_id: Optional[str] = None):
         """
         Initialize execution context.
@@ -79,12 +119,28 @@ class ExecutionContext:
             for name, step in workflow.steps.items()
         }
         
+        # Per-step memory requirement in bytes, parsed once here instead
+        # of on every readiness probe and allocate/release pair.
+        self._step_mem_bytes: Dict[str, int] = {
+            name: self._parse_memory(step.resources.memory)
+            for name, step in workflow.steps.items()
+        }
+        
         # Initialize resource tracking
         self.allocated_cpus = 0
         self.allocated_memory = 0  # in bytes
         self.allocated_gpus = 0
         
-        # Initialize environment
+        # Cached host capacity: CPU and GPU counts are fixed for a run,
+        # and available memory is re-read at most every poll interval
+        # instead of on every scheduling probe.
+        self._total_cpus = os.cpu_count() or 1
+        self._available_gpus: Optional[int] = None
+        self._available_memory = 0
+        self._mem_checked_at = float('-inf')
+        
+        # Run-level environment passed to each step process at spawn time;
+        # the orchestrator's own environment is left untouched.
         self.env_vars = {
             "BIOFLOW_RUN_ID": self.run_id,
             "BIOFLOW_WORK_DIR": str(self.work_dir),
@@ -95,16 +151,13 @@ class ExecutionContext:
     def setup(self) -> None:
         """Set up execution environment."""
         try:
-            # Create working directories
-            self.work_dir.mkdir(parents=True, exist_ok=True)
-            self.logs_dir.mkdir(parents=True, exist_ok=True)
-            self.temp_dir.mkdir(parents=True, exist_ok=True)
+            # Create working directories; mkdir with exist_ok already
+            # handles pre-existing directories, no separate exists() probes
+            for directory in (self.work_dir, self.logs_dir, self.temp_dir):
+                directory.mkdir(parents=True, exist_ok=True)
             
             debug("Created working directories under: {}", self.work_dir)
             
-            # Set up environment variables
-            os.environ.update(self.env_vars)
-            
         except Exception as e:
             error("Failed to set up execution environment: {}", str(e))
             raise ExecutionError(f"Failed to set up execution environment: {str(e)}")
@@ -114,7 +167,6 @@ class ExecutionContext:
         try:
             # Remove temporary directory
             if self.temp_dir.exists():
-                import shutil
                 shutil.rmtree(self.temp_dir)
             
             debug("Cleaned up temporary directory: {}", self.temp_dir)
@@ -135,19 +187,24 @@ class ExecutionContext:
         resources = step.resources
         
         # Check CPU availability
-        if self.allocated_cpus + resources.cpu > os.cpu_count():
+        if self.allocated_cpus + resources.cpu > self._total_cpus:
             return False
         
         # Check memory availability (simple check, can be improved)
-        import psutil
-        available_memory = psutil.virtual_memory().available
-        required_memory = self._parse_memory(resources.memory)
-        if self.allocated_memory + required_memory > available_memory:
+        now = time.monotonic()
+        if now - self._mem_checked_at > self._MEM_POLL_INTERVAL:
+            self._available_memory = psutil.virtual_memory().available
+            self._mem_checked_at = now
+        required_memory = self._step_mem_bytes[step_name]
+        if self.allocated_memory + required_memory > self._available_memory:
             return False
         
         # Check GPU availability if required
-        if resources.gpu and self.allocated_gpus + resources.gpu > self._get_available_gpus():
-            return False
+        if resources.gpu:
+            if self._available_gpus is None:
+                self._available_gpus = self._get_available_gpus()
+            if self.allocated_gpus + resources.gpu > self._available_gpus:
+                return False
         
         return True
     
@@ -157,7 +214,7 @@ class ExecutionContext:
         resources = step.resources
         
         self.allocated_cpus += resources.cpu
-        self.allocated_memory += self._parse_memory(resources.memory)
+        self.allocated_memory += self._step_mem_bytes[step_name]
         if resources.gpu:
             self.allocated_gpus += resources.gpu
     
@@ -167,34 +224,27 @@ class ExecutionContext:
         resources = step.resources
         
         self.allocated_cpus -= resources.cpu
-        self.allocated_memory -= self._parse_memory(resources.memory)
+        self.allocated_memory -= self._step_mem_bytes[step_name]
         if resources.gpu:
             self.allocated_gpus -= resources.gpu
     
     @staticmethod
     def _parse_memory(memory_str: str) -> int:
         """Parse memory string to bytes."""
-        units = {
-            'B': 1,
-            'KB': 1024,
-            'MB': 1024**2,
-            'GB': 1024**3,
-            'TB': 1024**4
-        }
+        text = memory_str.strip()
+        i = 0
+        while i < len(text) and text[i].isdigit():
+            i += 1
         
-        import re
-        match = re.match(r'(\d+)\s*([KMGT]?B)', memory_str.upper())
-        if not match:
+        multiplier = _MEMORY_UNITS.get(text[i:].strip().upper()) if i else None
+        if multiplier is None:
             raise ExecutionError(f"Invalid memory format: {memory_str}")
         
-        value, unit = match.groups()
-        return int(value) * units[unit]
+        return int(text[:i]) * multiplier
     
     @staticmethod
     def _get_available_gpus() -> int:
         """Get number of available GPUs."""
-        try:
-            import torch
+        if _HAS_TORCH:
             return torch.cuda.device_count()
-        except ImportError:
-            return 0  # No GPU support 
\ No newline at end of file
+        return 0  # No GPU support 
\ No newline at end of file
@@ -7,11 +7,11 @@ coordinating between the scheduler, context, and container runtime.
 
 import os
 import sys
-import time
 import signal
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, Future
 import subprocess
+from itertools import chain
 from pathlib import Path
 
 from ..core.models import Workflow, Step
@@ -46,15 +46,27 @@ class ExecutionEngine:
         self.context = ExecutionContext(workflow)
         self.scheduler = TaskScheduler(self.context)
         
-        # Initialize thread pool
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
-        self.futures: Dict[str, Future] = {}
+        # Initialize thread pool; a workflow can never occupy more
+        # workers than it has steps, so don't spawn idle threads for it
+        effective_workers = min(self.max_workers, len(workflow.steps)) or 1
+        self.executor = ThreadPoolExecutor(max_workers=effective_workers)
+        # One slot per step, indexed by the scheduler's step id; a dict
+        # would re-hash step names on every submit/cleanup cycle
+        self.futures: List[Optional[Future]] = [None] * len(workflow.steps)
         
         # Initialize signal handling
         self._setup_signal_handlers()
         
         # Track container IDs for cleanup
         self.containers: Set[str] = set()
+        
+        # Everything in a step's docker argv except the command itself is
+        # fixed at load time; precompute it so repeated executions (e.g.
+        # foreach expansions) only append the dynamic tail
+        self._step_argv_prefix: Dict[str, Tuple[str, ...]] = {
+            name: self._build_argv_prefix(step)
+            for name, step in workflow.steps.items()
+        }
     
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown."""
@@ -79,22 +91,25 @@ class ExecutionEngine:
             
             # Main execution loop
             while not self.scheduler.is_complete():
-                # Get next step to execute
-                step_name = self.scheduler.get_next_step()
-                if step_name:
-                    # Submit step for execution
+                # Submit every step that is currently ready to run
+                while True:
+                    step_name = self.scheduler.get_next_step()
+                    if step_name is None:
+                        break
                     future = self.executor.submit(self._execute_step, step_name)
-                    self.futures[step_name] = future
+                    self.futures[self.scheduler.name_to_id[step_name]] = future
                 
                 # Clean up completed futures
                 self._cleanup_futures()
                 
-                # Short sleep to prevent busy waiting
-                time.sleep(0.1)
+                # Sleep until a step finishes instead of polling on a timer;
+                # the timeout only bounds shutdown latency on external signals
+                self.scheduler.wait_for_update(timeout=1.0)
             
             # Wait for any remaining futures
-            for future in self.futures.values():
-                future.result()
+            for future in self.futures:
+                if future is not None:
+                    future.result()
             
             success = not self.scheduler.has_failed_steps()
             if success:
@@ -122,98 +137,111 @@ class ExecutionEngine:
             self.scheduler.mark_step_running(step_name)
             
             # Prepare container command
-            container_cmd = self._prepare_container_command(step)
-            
-            # Execute container
-            process = subprocess.Popen(
-                container_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                env=dict(os.environ, **step_context.env_vars)
-            )
-            
-            # Store container ID for cleanup
-            if process.stdout:
-                container_id = process.stdout.readline().strip()
-                step_context.container_id = container_id
-                self.containers.add(container_id)
-            
-            # Monitor execution
-            stdout, stderr = process.communicate()
-            exit_code = process.returncode
-            
+            container_cmd = [*self._step_argv_prefix[step_name], step.command]
+
+            # Track the container by its deterministic name for cleanup
+            container_name = self._container_name(step_name)
+            step_context.container_id = container_name
+            self.containers.add(container_name)
+
+            # Stream container output straight to a per-step log file:
+            # the kernel writes it without buffering gigabytes of tool
+            # chatter into Python strings, and the log survives the run.
+            # Run the container in the foreground so the exit code below
+            # is the container's own, not `docker run -d`'s
+            log_path = self.context.logs_dir / f"{step_name}.log"
+            with open(log_path, "wb") as log_file:
+                process = subprocess.Popen(
+                    container_cmd,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    env={**os.environ, **self.context.env_vars, **step_context.env_vars}
+                )
+                exit_code = process.wait()
+
             # Handle completion
             if exit_code == 0:
                 self.scheduler.mark_step_completed(step_name, exit_code)
             else:
-                error_msg = f"Step failed with exit code {exit_code}:\n{stderr}"
+                error_msg = (
+                    f"Step failed with exit code {exit_code}; "
+                    f"last output (full log: {log_path}):\n{self._read_log_tail(log_path)}"
+                )
                 self.scheduler.mark_step_failed(step_name, error_msg, exit_code)
-            
-            # Remove container ID
-            if step_context.container_id:
-                self.containers.remove(step_context.container_id)
-            
+
+            self.containers.discard(container_name)
+
         except Exception as e:
             error("Failed to execute step {}: {}", step_name, str(e))
             self.scheduler.mark_step_failed(step_name, str(e))
     
-    def _prepare_container_command(self, step: Step) -> List[str]:
-        """Prepare container execution command."""
-        # Basic docker run command
-        cmd = ["docker", "run", "-d"]  # Run in detached mode
-        
-        # Add resource limits
+    @staticmethod
+    def _read_log_tail(log_path: Path, max_bytes: int = 8192) -> str:
+        """Read the last max_bytes of a step log for error reporting."""
+        try:
+            with open(log_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - max_bytes))
+                return f.read().decode(errors="replace")
+        except OSError:
+            return "<log unavailable>"
+
+    def _container_name(self, step_name: str) -> str:
+        """Deterministic container name for a step within this run."""
+        return f"bioflow_{self.context.run_id}_{step_name}"
+
+    def _build_argv_prefix(self, step: Step) -> Tuple[str, ...]:
+        """Build the static part of a step's docker argv, up to the shell.
+
+        The caller appends the (possibly variable-resolved) step command
+        as the final element.
+        """
         resources = step.resources
-        cmd.extend([
+        container = step.container
+        # Run in the foreground under a predictable name; --rm removes the
+        # container once it exits so completed steps leave nothing behind.
+        # Built as one flat tuple rather than a run of two-element extends
+        return (
+            "docker", "run", "--rm", "--name", self._container_name(step.name),
+            # Resource limits
             "--cpu-count", str(resources.cpu),
             "--memory", resources.memory,
-        ])
-        if resources.gpu:
-            cmd.extend(["--gpus", str(resources.gpu)])
-        
-        # Add volume mounts
-        for volume in step.container.volumes:
-            cmd.extend(["-v", volume])
-        
-        # Add environment variables
-        for key, value in step.container.env.items():
-            cmd.extend(["-e", f"{key}={value}"])
-        
-        # Add container image
-        cmd.append(f"{step.container.image}:{step.container.tag}")
-        
-        # Add command
-        cmd.extend(["/bin/sh", "-c", step.command])
-        
-        return cmd
+            *(("--gpus", str(resources.gpu)) if resources.gpu else ()),
+            # Volume mounts and environment variables
+            *chain.from_iterable(("-v", volume) for volume in container.volumes),
+            *chain.from_iterable(
+                ("-e", f"{key}={value}") for key, value in container.env.items()
+            ),
+            # Image, then the shell that receives the step command
+            f"{container.image}:{container.tag}",
+            "/bin/sh", "-c",
+        )
     
     def _cleanup_futures(self) -> None:
         """Clean up completed futures."""
-        completed = [
-            name for name, future in self.futures.items()
-            if future.done()
-        ]
-        for name in completed:
-            # Get result to propagate any exceptions
-            self.futures[name].result()
-            del self.futures[name]
+        for step_id, future in enumerate(self.futures):
+            if future is not None and future.done():
+                # Get result to propagate any exceptions
+                future.result()
+                self.futures[step_id] = None
     
     def shutdown(self) -> None:
         """Shutdown the execution engine."""
         try:
             # Cancel running futures
-            for future in self.futures.values():
-                future.cancel()
+            for future in self.futures:
+                if future is not None:
+                    future.cancel()
             
-            # Stop running containers
-            for container_id in self.containers:
-                try:
-                    subprocess.run(["docker", "stop", container_id], check=True)
-                    subprocess.run(["docker", "rm", container_id], check=True)
-                except subprocess.CalledProcessError:
-                    pass  # Ignore errors during cleanup
+            # Stop running containers; one docker invocation per verb
+            # instead of two forks per container
+            if self.containers:
+                containers = list(self.containers)
+                for verb in ("stop", "rm"):
+                    try:
+                        subprocess.run(["docker", verb, *containers], check=True)
+                    except subprocess.CalledProcessError:
+                        pass  # Ignore errors during cleanup
             
             # Shutdown thread pool
             self.executor.shutdown(wait=False)
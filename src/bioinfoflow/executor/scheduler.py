@@ -5,9 +5,9 @@ This module provides task scheduling functionality for workflow execution,
 managing dependencies and resource allocation.
 """
 
-from typing import Dict, List, Set, Optional
-from queue import Queue
-from threading import Lock
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from threading import Event, Lock
 import time
 
 from ..core.models import Workflow, Step
@@ -18,187 +18,211 @@ from .context import ExecutionContext, StepContext
 class TaskScheduler:
     """
     Task scheduler for workflow execution.
-    
+
     This class manages:
     - Task dependency resolution
     - Resource allocation
     - Task queuing and scheduling
     - Parallel execution management
+
+    Steps are assigned contiguous integer ids at construction; dependency
+    and state tracking use parallel arrays and int bitsets indexed by id,
+    so dependency checks are a single mask comparison instead of per-name
+    set lookups. Step names remain the public currency of the API.
     """
-    
+
     def __init__(self, context: ExecutionContext):
         """
         Initialize task scheduler.
-        
+
         Args:
             context: Execution context
         """
         self.context = context
         self.workflow = context.workflow
-        
-        # Initialize task queues
-        self.pending: Queue[str] = Queue()  # Steps ready to run
-        self.running: Set[str] = set()      # Currently running steps
-        self.completed: Set[str] = set()    # Completed steps
-        self.failed: Set[str] = set()       # Failed steps
-        
-        # Initialize dependency tracking
-        self.dependencies: Dict[str, Set[str]] = {}  # step -> dependencies
-        self.dependents: Dict[str, Set[str]] = {}    # step -> dependent steps
-        
+
+        # Step identity: id i corresponds to bit (1 << i) in the bitsets
+        self.id_to_name: List[str] = list(self.workflow.steps)
+        self.name_to_id: Dict[str, int] = {
+            name: i for i, name in enumerate(self.id_to_name)
+        }
+
+        # Queue of step ids whose dependencies are met
+        self.pending: deque[int] = deque()
+
+        # Step state as bitsets over step ids
+        self._running_mask = 0
+        self._completed_mask = 0
+        self._failed_mask = 0
+
+        # Per-id dependency mask and dependent ids, filled in below
+        self._deps_mask: List[int] = []
+        self._dependents: List[Tuple[int, ...]] = []
+
         # Thread safety
         self.lock = Lock()
-        
+
+        # Signalled whenever a step finishes, so the engine can sleep
+        # between scheduling decisions instead of polling.
+        self._wake = Event()
+
         # Build dependency graph
         self._build_dependency_graph()
-    
+
     def _build_dependency_graph(self) -> None:
         """Build the dependency graph for all steps."""
         try:
-            for name, step in self.workflow.steps.items():
-                # Initialize sets
-                self.dependencies[name] = set(step.after or [])
-                self.dependents[name] = set()
-                
-                # Add reverse dependencies
-                for dep in self.dependencies[name]:
-                    if dep not in self.workflow.steps:
+            n = len(self.id_to_name)
+            dependents: List[List[int]] = [[] for _ in range(n)]
+            in_degree = [0] * n
+
+            for step_id, name in enumerate(self.id_to_name):
+                mask = 0
+                for dep in self.workflow.steps[name].after or []:
+                    dep_id = self.name_to_id.get(dep)
+                    if dep_id is None:
                         raise SchedulerError(f"Unknown dependency: {dep} for step {name}")
-                    self.dependents[dep].add(name)
-            
-            # Validate no cycles
-            self._check_cycles()
-            
-            # Queue steps with no dependencies
-            for name, deps in self.dependencies.items():
-                if not deps:
-                    self.pending.put(name)
-            
-            debug("Built dependency graph with {} steps", len(self.workflow.steps))
-            
+                    mask |= 1 << dep_id
+                    dependents[dep_id].append(step_id)
+                self._deps_mask.append(mask)
+                in_degree[step_id] = mask.bit_count()
+
+            self._dependents = [tuple(ids) for ids in dependents]
+
+            # Kahn sweep: queue dependency-free steps and detect cycles in
+            # the same O(V+E) pass that previously took a separate DFS
+            ready = deque(
+                step_id for step_id, degree in enumerate(in_degree) if degree == 0
+            )
+            self.pending.extend(ready)
+
+            visited = 0
+            while ready:
+                current = ready.popleft()
+                visited += 1
+                for dependent in self._dependents[current]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        ready.append(dependent)
+
+            if visited != n:
+                cyclic = sorted(
+                    self.id_to_name[step_id]
+                    for step_id, degree in enumerate(in_degree)
+                    if degree > 0
+                )
+                raise SchedulerError(
+                    f"Circular dependency detected among steps: {', '.join(cyclic)}"
+                )
+
+            debug("Built dependency graph with {} steps", n)
+
         except Exception as e:
             error("Failed to build dependency graph: {}", str(e))
             raise SchedulerError(f"Failed to build dependency graph: {str(e)}")
-    
-    def _check_cycles(self) -> None:
-        """Check for cycles in the dependency graph."""
-        visited = set()
-        path = set()
-        
-        def dfs(step: str) -> None:
-            if step in path:
-                path_list = list(path)
-                cycle_start = path_list.index(step)
-                cycle = path_list[cycle_start:] + [step]
-                raise SchedulerError(f"Circular dependency detected: {' -> '.join(cycle)}")
-            
-            if step in visited:
-                return
-            
-            visited.add(step)
-            path.add(step)
-            
-            for dep in self.dependents[step]:
-                dfs(dep)
-            
-            path.remove(step)
-        
-        # Start DFS from each unvisited node
-        for step in self.workflow.steps:
-            if step not in visited:
-                dfs(step)
-    
+
     def get_next_step(self) -> Optional[str]:
         """
         Get the next step to execute.
-        
+
         Returns:
             Step name if available, None otherwise
         """
         with self.lock:
-            # Check pending queue
-            while not self.pending.empty():
-                step_name = self.pending.get()
-                
+            # Entries only reach the queue once their dependencies are met,
+            # so resources are the one thing that can block them. Rotate
+            # through the queue at most once: blocked steps are re-queued
+            # in order so a large step at the head cannot starve runnable
+            # siblings behind it, and a full fruitless rotation yields None
+            for _ in range(len(self.pending)):
+                step_id = self.pending.popleft()
+
                 # Skip if already running or completed
-                if step_name in self.running or step_name in self.completed:
+                if (self._running_mask | self._completed_mask) & (1 << step_id):
                     continue
-                
-                # Check if dependencies are met
-                if not self._are_dependencies_met(step_name):
-                    self.pending.put(step_name)  # Put back in queue
-                    continue
-                
-                # Check resource availability
-                if not self.context.can_run_step(step_name):
-                    self.pending.put(step_name)  # Put back in queue
-                    continue
-                
-                return step_name
-            
+
+                step_name = self.id_to_name[step_id]
+                if self.context.can_run_step(step_name):
+                    return step_name
+
+                self.pending.append(step_id)
+
             return None
-    
-    def _are_dependencies_met(self, step_name: str) -> bool:
+
+    def _are_dependencies_met(self, step_id: int) -> bool:
         """Check if all dependencies for a step are met."""
-        return all(
-            dep in self.completed
-            for dep in self.dependencies[step_name]
-        )
-    
+        deps = self._deps_mask[step_id]
+        return (self._completed_mask & deps) == deps
+
     def mark_step_running(self, step_name: str) -> None:
         """Mark a step as running."""
         with self.lock:
-            if step_name in self.running:
+            bit = 1 << self.name_to_id[step_name]
+            if self._running_mask & bit:
                 raise SchedulerError(f"Step already running: {step_name}")
-            
-            self.running.add(step_name)
+
+            self._running_mask |= bit
             self.context.get_step_context(step_name).mark_running()
             self.context.allocate_resources(step_name)
-            
+
             debug("Marked step as running: {}", step_name)
-    
+
     def mark_step_completed(self, step_name: str, exit_code: int = 0) -> None:
         """Mark a step as completed."""
         with self.lock:
-            if step_name not in self.running:
+            step_id = self.name_to_id[step_name]
+            bit = 1 << step_id
+            if not self._running_mask & bit:
                 raise SchedulerError(f"Step not running: {step_name}")
-            
-            self.running.remove(step_name)
-            self.completed.add(step_name)
+
+            self._running_mask &= ~bit
+            self._completed_mask |= bit
             self.context.get_step_context(step_name).mark_completed(exit_code)
             self.context.release_resources(step_name)
-            
+
             # Queue dependent steps
-            for dependent in self.dependents[step_name]:
+            for dependent in self._dependents[step_id]:
                 if self._are_dependencies_met(dependent):
-                    self.pending.put(dependent)
-            
+                    self.pending.append(dependent)
+
+            self._wake.set()
             debug("Marked step as completed: {}", step_name)
-    
+
     def mark_step_failed(self, step_name: str, error_msg: str, exit_code: int = 1) -> None:
         """Mark a step as failed."""
         with self.lock:
-            if step_name not in self.running:
+            bit = 1 << self.name_to_id[step_name]
+            if not self._running_mask & bit:
                 raise SchedulerError(f"Step not running: {step_name}")
-            
-            self.running.remove(step_name)
-            self.failed.add(step_name)
+
+            self._running_mask &= ~bit
+            self._failed_mask |= bit
             self.context.get_step_context(step_name).mark_failed(error_msg, exit_code)
             self.context.release_resources(step_name)
-            
+
+            self._wake.set()
             debug("Marked step as failed: {}", step_name)
-    
+
+    def wait_for_update(self, timeout: Optional[float] = None) -> None:
+        """Block until a step finishes or the timeout elapses."""
+        self._wake.wait(timeout)
+        self._wake.clear()
+
     def is_complete(self) -> bool:
         """Check if workflow execution is complete."""
+        finished = self._completed_mask | self._failed_mask
         return (
-            len(self.completed) + len(self.failed) == len(self.workflow.steps)
-            and len(self.running) == 0
+            finished.bit_count() == len(self.id_to_name)
+            and self._running_mask == 0
         )
-    
+
     def has_failed_steps(self) -> bool:
         """Check if any steps have failed."""
-        return len(self.failed) > 0
-    
+        return self._failed_mask != 0
+
     def get_failed_steps(self) -> List[str]:
         """Get list of failed steps."""
-        return list(self.failed) 
\ No newline at end of file
+        return [
+            name for step_id, name in enumerate(self.id_to_name)
+            if self._failed_mask & (1 << step_id)
+        ]
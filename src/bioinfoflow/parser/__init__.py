@@ -5,6 +5,6 @@ This module provides functionality for parsing workflow definitions
 and related configuration files.
 """
 
-from .workflow import parse_workflow
+from .workflow import parse_workflow, parse_workflows
 
-__all__ = ["parse_workflow"] 
\ No newline at end of file
+__all__ = ["parse_workflow", "parse_workflows"] 
\ No newline at end of file
@@ -5,12 +5,21 @@ This module provides functionality to parse workflow YAML files into
 BioinfoFlow model objects and validate their structure.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterable, Optional, Union
 
 import yaml
 from yaml.parser import ParserError
 
+try:
+    # libyaml-backed loader: same semantics as SafeLoader, several times faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from ..core.models import (
     Workflow,
     WorkflowConfig,
@@ -25,6 +34,28 @@ from ..core.exceptions import WorkflowParseError
 from ..validators.base import validate_workflow, ValidationError
 from ..utils.logging import debug, info, error, set_workflow_context, clear_context
 
+# Value -> member lookup for InputType, avoiding per-parse enum scans
+_INPUT_TYPE_LOOKUP = {member.value: member for member in InputType}
+
+# Workflows with more steps than this are parsed across processes;
+# below it, process startup costs more than the parallel parse saves
+_PARALLEL_STEP_THRESHOLD = 50
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Load and parse a YAML file, keyed by path plus stat fingerprint.
+
+    The mtime/size arguments only serve as cache keys: an unchanged file
+    skips re-parsing on repeated loads (validate, visualize, run), while
+    any on-disk change produces a fresh parse.
+
+    The file is slurped as bytes so the loader parses one contiguous
+    buffer instead of pulling decoded chunks through a text-mode file
+    object.
+    """
+    return yaml.load(Path(path).read_bytes(), Loader=_YamlLoader)
+
 def _parse_resource_requirements(data: Dict[str, Any]) -> ResourceRequirements:
     """Parse resource requirements from YAML data."""
     try:
@@ -42,9 +73,12 @@ def _parse_container_config(data: Dict[str, Any]) -> ContainerConfig:
     """Parse container configuration from YAML data."""
     try:
         if isinstance(data, str):
-            # Handle shorthand notation: container: "image:tag"
-            image = data.split(":")[0]
-            tag = data.split(":")[1] if ":" in data else "latest"
+            # Handle shorthand notation: container: "image:tag".
+            # A slash after the last colon means the colon belonged to a
+            # registry port (registry.io:5000/image), not a tag.
+            image, sep, tag = data.rpartition(":")
+            if not sep or "/" in tag:
+                image, tag = data, "latest"
             debug("Parsing container shorthand notation: image={}, tag={}", image, tag)
             return ContainerConfig(image=image, tag=tag)
         
@@ -61,13 +95,16 @@ def _parse_container_config(data: Dict[str, Any]) -> ContainerConfig:
 def _parse_input_config(data: Dict[str, Any]) -> InputConfig:
     """Parse input configuration from YAML data."""
     try:
-        input_type = InputType.SAMPLE_GROUP if data["type"] == "sample_group" else InputType.FILE
+        input_type = _INPUT_TYPE_LOOKUP.get(data["type"], InputType.FILE)
         debug("Parsing input configuration: type={}", input_type.value)
+        # Copy the columns list so the model does not alias the cached
+        # parse tree (see _parse_step)
+        columns = data.get("columns")
         return InputConfig(
             type=input_type,
             pattern=data["pattern"],
             format=data.get("format"),
-            columns=data.get("columns"),
+            columns=list(columns) if columns is not None else None,
             description=data.get("description"),
         )
     except KeyError as e:
@@ -103,14 +140,17 @@ def _parse_step(name: str, data: Dict[str, Any]) -> Step:
         for out_name, out_data in data.get("outputs", {}).items():
             outputs[out_name] = _parse_output_config(out_data)
         
+        # inputs and after get fresh containers: the parse tree is shared
+        # by the _load_yaml_cached cache, and a model aliasing it would
+        # leak caller mutations into every later parse of the same file
         return Step(
             name=name,
             container=_parse_container_config(data["container"]),
             command=data["command"],
-            inputs=data.get("inputs", {}),
+            inputs=dict(data.get("inputs", {})),
             outputs=outputs,
             resources=_parse_resource_requirements(data.get("resources", {})),
-            after=data.get("after", []),
+            after=list(data.get("after", [])),
             foreach=data.get("foreach"),
         )
     except KeyError as e:
@@ -120,6 +160,23 @@ def _parse_step(name: str, data: Dict[str, Any]) -> Step:
         error("Failed to parse step {}: {}", name, str(e))
         raise WorkflowParseError(f"Invalid step configuration for {name}: {str(e)}")
 
+def _parse_steps(data: Dict[str, Any]) -> Dict[str, Step]:
+    """Parse all workflow steps, in parallel for large workflows.
+
+    Step construction is CPU-bound pure-Python work, so very large
+    workflows are spread over a process pool; _parse_step is a top-level
+    function and Step a plain dataclass, so both cross the pickle
+    boundary unchanged.
+    """
+    items = data.get("steps", {})
+    if len(items) <= _PARALLEL_STEP_THRESHOLD:
+        return {name: _parse_step(name, step_data)
+                for name, step_data in items.items()}
+
+    debug("Parsing {} steps in parallel", len(items))
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return dict(zip(items, executor.map(_parse_step, items, items.values())))
+
 def _parse_workflow_config(data: Dict[str, Any]) -> WorkflowConfig:
     """Parse workflow configuration from YAML data."""
     try:
@@ -157,8 +214,8 @@ def parse_workflow(yaml_path: Union[str, Path]) -> Workflow:
         raise WorkflowParseError(f"Workflow file not found: {yaml_path}")
     
     try:
-        with yaml_path.open() as f:
-            data = yaml.safe_load(f)
+        stat = yaml_path.stat()
+        data = _load_yaml_cached(str(yaml_path), stat.st_mtime_ns, stat.st_size)
     except ParserError as e:
         error("Invalid YAML format: {}", str(e))
         raise WorkflowParseError(f"Invalid YAML format: {str(e)}")
@@ -174,8 +231,7 @@ def parse_workflow(yaml_path: Union[str, Path]) -> Workflow:
             config=_parse_workflow_config(data.get("config", {})),
             inputs={name: _parse_input_config(input_data)
                    for name, input_data in data.get("inputs", {}).items()},
-            steps={name: _parse_step(name, step_data)
-                  for name, step_data in data.get("steps", {}).items()},
+            steps=_parse_steps(data),
         )
     except KeyError as e:
         error("Missing required field in workflow: {}", str(e))
@@ -196,4 +252,36 @@ def parse_workflow(yaml_path: Union[str, Path]) -> Workflow:
         error("Workflow validation failed: {}", str(e))
         raise
     
-    return workflow 
\ No newline at end of file
+    return workflow
+
+def parse_workflows(
+    yaml_paths: Iterable[Union[str, Path]],
+    max_workers: Optional[int] = None,
+) -> Dict[Path, Workflow]:
+    """
+    Parse and validate multiple workflow files.
+
+    Small batches are parsed serially; larger ones are distributed over a
+    process pool, since YAML parsing and validation are CPU-bound
+    pure-Python work that threads cannot parallelize.
+
+    Args:
+        yaml_paths: Paths to workflow YAML files
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        Mapping of each path to its parsed Workflow
+
+    Raises:
+        WorkflowParseError: If any workflow fails to parse
+        ValidationError: If any workflow fails validation
+    """
+    paths = [Path(p) for p in yaml_paths]
+
+    # Below this size, process startup costs more than it saves
+    if len(paths) <= 4:
+        return {path: parse_workflow(path) for path in paths}
+
+    info("Parsing {} workflow files in parallel", len(paths))
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return dict(zip(paths, executor.map(parse_workflow, paths)))
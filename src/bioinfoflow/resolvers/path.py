@@ -6,6 +6,7 @@ in workflow configurations.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Dict, List, Optional
 from copy import deepcopy
@@ -14,6 +15,19 @@ from ..core.models import Workflow, Step, InputConfig, OutputConfig
 from ..core.exceptions import PathResolutionError
 from ..utils.logging import debug, error
 
+@lru_cache(maxsize=4096)
+def _normalize_cached(path_str: str, base_dir_str: str) -> str:
+    """Resolve path_str against base_dir_str, memoized on both strings.
+
+    Path.resolve walks every component on disk, so workflows whose inputs
+    and outputs share directory prefixes repeat the same realpath work;
+    the cache collapses those into one resolution per distinct pair.
+    """
+    path = Path(path_str)
+    if not path.is_absolute():
+        path = Path(base_dir_str) / path
+    return str(path.resolve())
+
 def normalize_path(path: Union[str, Path], base_dir: Optional[Path] = None) -> Path:
     """
     Normalize a path, resolving it against a base directory if provided.
@@ -26,33 +40,34 @@ def normalize_path(path: Union[str, Path], base_dir: Optional[Path] = None) -> P
         Normalized Path object
     """
     try:
-        path = Path(path)
-        if base_dir and not path.is_absolute():
-            path = base_dir / path
-        return path.resolve()
+        if base_dir:
+            # Cacheable: with a base directory the result depends only on
+            # the two arguments, never on the current working directory
+            return Path(_normalize_cached(str(path), str(base_dir)))
+        return Path(path).resolve()
     except Exception as e:
         error("Failed to normalize path: {} ({})", path, str(e))
         raise PathResolutionError(f"Failed to normalize path: {path}")
 
 def _resolve_input_paths(input_config: InputConfig, base_dir: Path) -> InputConfig:
-    """Resolve paths in an input configuration."""
+    """Resolve paths in an input configuration.
+
+    The input config is mutated in place; callers pass sub-objects of the
+    workflow copy made by resolve_paths.
+    """
     debug("Resolving paths in input configuration")
     
-    input_config = deepcopy(input_config)
-    
     # Normalize pattern path
     if input_config.pattern:
         try:
             # eg. input_config.pattern = "data/*.csv"
             # Don't resolve glob patterns, just normalize the directory part
-            pattern_parts = input_config.pattern.split('/')
-            if len(pattern_parts) > 1:
-                # eg. pattern_parts = ["data", "*.csv"]
-                dir_part = '/'.join(pattern_parts[:-1])
-                # eg. dir_part = "data"
+            dir_part, sep, last = input_config.pattern.rpartition('/')
+            if sep:
+                # eg. dir_part = "data", last = "*.csv"
                 dir_path = normalize_path(dir_part, base_dir)
                 # eg. dir_path = "/absolute/path/to/data"
-                input_config.pattern = str(dir_path / pattern_parts[-1])
+                input_config.pattern = f"{dir_path}/{last}"
                 # eg. input_config.pattern = "/absolute/path/to/data/*.csv"
             else:
                 input_config.pattern = str(base_dir / input_config.pattern)
@@ -60,22 +75,22 @@ def _resolve_input_paths(input_config: InputConfig, base_dir: Path) -> InputConf
         except Exception as e:
             error("Failed to resolve input pattern: {} ({})", input_config.pattern, str(e))
             raise PathResolutionError(f"Failed to resolve input pattern: {input_config.pattern}")
-        except Exception as e:
-            error("Failed to resolve input pattern: {} ({})", input_config.pattern, str(e))
-            raise PathResolutionError(f"Failed to resolve input pattern: {input_config.pattern}")
-    
+
     return input_config
 
 def _resolve_output_paths(output_config: OutputConfig, base_dir: Path) -> OutputConfig:
-    """Resolve paths in an output configuration."""
+    """Resolve paths in an output configuration.
+
+    The output config is mutated in place; callers pass sub-objects of the
+    workflow copy made by resolve_paths.
+    """
     debug("Resolving paths in output configuration")
     
-    output_config = deepcopy(output_config)
-    
     # Normalize output path
     try:
-        # Don't resolve variable references (${...}), they're handled by variable resolver
-        if not "${" in output_config.path:
+        # Don't resolve variable references (${...}), they're handled by
+        # variable resolver; the flag is computed once at construction
+        if not output_config.has_variables:
             output_config.path = str(normalize_path(output_config.path, base_dir))
     except Exception as e:
         error("Failed to resolve output path: {} ({})", output_config.path, str(e))
@@ -88,7 +103,8 @@ def _resolve_step_outputs(step: Step, base_dir: Path) -> Step:
     Resolve output paths in a workflow step.
     
     Args:
-        step: Step configuration to resolve
+        step: Step configuration to resolve (mutated in place; callers pass
+            steps of the workflow copy made by resolve_paths)
         base_dir: Base directory to resolve paths against
         
     Returns:
@@ -96,14 +112,17 @@ def _resolve_step_outputs(step: Step, base_dir: Path) -> Step:
     """
     debug("Resolving output paths in step: {}", step.name)
     
-    step = deepcopy(step)
-    
     # Resolve output paths
     resolved_outputs = {}
     for name, output in step.outputs.items():
         resolved_outputs[name] = _resolve_output_paths(output, base_dir)
     step.outputs = resolved_outputs
-    
+
+    # The paths were rewritten in place on a deepcopied step, which keeps
+    # any cached output_paths view from the original; drop it so the next
+    # access recomputes from the resolved paths
+    step.__dict__.pop("output_paths", None)
+
     return step
 
 def resolve_paths(workflow: Workflow) -> Workflow:
@@ -6,8 +6,9 @@ in workflow configurations.
 """
 
 import re
-from typing import Any, Dict, Optional, Union
-from copy import deepcopy
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
 from ..core.models import Workflow, Step, InputConfig, OutputConfig
 from ..core.exceptions import VariableResolutionError
@@ -16,8 +17,22 @@ from ..utils.logging import debug, error
 # Regex for finding ${...} references
 VAR_PATTERN = re.compile(r'\${([^}]+)}')
 
+def _flatten_context(prefix: str, obj: Any, out: Dict[str, Any]) -> None:
+    """Flatten nested context dicts into dotted-path keys."""
+    for key, value in obj.items():
+        dotted = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            _flatten_context(dotted, value, out)
+        else:
+            out[dotted] = value
+
 class VariableContext:
-    """Context for variable resolution."""
+    """Context for variable resolution.
+
+    Alongside the nested context dict, a flattened table maps each dotted
+    reference path straight to its leaf value, so resolving \${a.b.c} is
+    one dict lookup instead of a walk per path component.
+    """
     
     def __init__(self, workflow: Workflow, step: Optional[Step] = None, sample: Optional[Dict[str, Any]] = None):
         self.workflow = workflow
@@ -36,13 +51,52 @@ class VariableContext:
         if step:
             self.context["step"] = {
                 "name": step.name,
-                "resources": step.resources.__dict__,
+                "resources": step.resources_dict,
             }
             self.context["inputs"] = step.inputs
-            self.context["outputs"] = {k: v.path for k, v in step.outputs.items()}
+            self.context["outputs"] = step.output_paths
         
         if sample:
             self.context["sample"] = sample
+        
+        # Dotted-path lookup table over the nested dict above
+        self.flat: Dict[str, Any] = {}
+        _flatten_context("", self.context, self.flat)
+
+    def for_step(self, step: Step) -> "VariableContext":
+        """Derive a step-scoped context from this workflow-level one.
+
+        The config and workflow entries, shared by every step, are copied
+        by reference; only the step-specific keys and their flat-table
+        entries are built fresh.
+        """
+        derived = VariableContext.__new__(VariableContext)
+        derived.workflow = self.workflow
+        derived.step = step
+        derived.sample = self.sample
+
+        step_entries = {
+            "step": {
+                "name": step.name,
+                "resources": step.resources_dict,
+            },
+            "inputs": step.inputs,
+            "outputs": step.output_paths,
+        }
+        derived.context = {**self.context, **step_entries}
+        derived.flat = dict(self.flat)
+        _flatten_context("", step_entries, derived.flat)
+        return derived
+
+@lru_cache(maxsize=1024)
+def _split_ref(ref: str) -> Tuple[str, ...]:
+    """Split a dotted reference into its parts, memoized.
+
+    The same handful of references (config paths, sample fields) recurs
+    across most steps of a workflow, so each distinct one is tokenized
+    exactly once.
+    """
+    return tuple(ref.split('.'))
 
 def _resolve_reference(ref: str, context: Dict[str, Any]) -> Any:
     """
@@ -56,9 +110,8 @@ def _resolve_reference(ref: str, context: Dict[str, Any]) -> Any:
     - ${outputs.vcf}
     """
     try:
-        parts = ref.split('.')
         value = context
-        for part in parts:
+        for part in _split_ref(ref):
             value = value[part]
         return value
     except KeyError:
@@ -68,21 +121,66 @@ def _resolve_reference(ref: str, context: Dict[str, Any]) -> Any:
         error("Failed to resolve variable reference: {} ({})", ref, str(e))
         raise VariableResolutionError(f"Failed to resolve variable reference: {ref}")
 
-def _resolve_string(text: str, context: Dict[str, Any]) -> str:
-    """Resolve all variable references in a string."""
-    def replace(match: re.Match) -> str:
-        ref = match.group(1)
-        value = _resolve_reference(ref, context)
-        if not isinstance(value, (str, int, float)):
-            error("Invalid variable reference type: {} ({})", ref, type(value))
-            raise VariableResolutionError(
-                f"Invalid variable reference type: {ref} ({type(value)}). "
-                "Only strings and numbers can be interpolated."
-            )
-        return str(value)
-    
+@lru_cache(maxsize=4096)
+def _compile_template(text: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Pre-parse a template into (literal, reference) segments.
+
+    The regex scans each distinct template exactly once; rendering then
+    walks the segments with plain lookups. Under foreach expansion the
+    same command template is rendered once per sample, so this moves the
+    regex out of the per-render path entirely.
+    """
+    segments = []
+    pos = 0
+    for match in VAR_PATTERN.finditer(text):
+        segments.append((text[pos:match.start()], match.group(1)))
+        pos = match.end()
+    segments.append((text[pos:], None))
+    return tuple(segments)
+
+def _resolve_string(text: str, context: "VariableContext",
+                    cache: Optional[Dict[str, str]] = None) -> str:
+    """
+    Resolve all variable references in a string.
+
+    References hit the context's flattened table first and only fall back
+    to the nested walk for paths the flattening could not precompute. An
+    optional cache maps already-resolved references to their string
+    values, so repeated references (e.g. the same config path in several
+    places of one step) skip even that lookup.
+    """
+    # Fast path: most strings contain no references at all, and a plain
+    # substring check is far cheaper than running the regex engine.
+    if "${" not in text:
+        return text
+
+    flat = context.flat
+
     try:
-        return VAR_PATTERN.sub(replace, text)
+        parts = []
+        for literal, ref in _compile_template(text):
+            if literal:
+                parts.append(literal)
+            if ref is None:
+                continue
+            if cache is not None and ref in cache:
+                parts.append(cache[ref])
+                continue
+            if ref in flat:
+                value = flat[ref]
+            else:
+                value = _resolve_reference(ref, context.context)
+            if not isinstance(value, (str, int, float)):
+                error("Invalid variable reference type: {} ({})", ref, type(value))
+                raise VariableResolutionError(
+                    f"Invalid variable reference type: {ref} ({type(value)}). "
+                    "Only strings and numbers can be interpolated."
+                )
+            resolved = str(value)
+            if cache is not None:
+                cache[ref] = resolved
+            parts.append(resolved)
+        return "".join(parts)
     except Exception as e:
         error("Failed to resolve variables in string: {} ({})", text, str(e))
         raise VariableResolutionError(f"Failed to resolve variables in string: {text}")
@@ -91,24 +189,35 @@ def resolve_step_variables(step: Step, context: VariableContext) -> Step:
     """Resolve variables in a workflow step."""
     debug("Resolving variables in step: {}", step.name)
     
-    # Create a copy to avoid modifying the original
-    step = deepcopy(step)
+    # Copy only what resolution actually mutates: outputs have their paths
+    # rewritten in place, while command and inputs are reassigned wholesale.
+    # Container and resources are never touched and stay shared.
+    step = replace(
+        step,
+        outputs={name: replace(output) for name, output in step.outputs.items()},
+    )
+    
+    # References resolved once for this step are reused across its
+    # command, inputs and outputs.
+    ref_cache: Dict[str, str] = {}
     
     # Resolve command
-    step.command = _resolve_string(step.command, context.context)
+    step.command = _resolve_string(step.command, context, ref_cache)
     
     # Resolve input references
     resolved_inputs = {}
     for name, value in step.inputs.items():
         if isinstance(value, str):
-            resolved_inputs[name] = _resolve_string(value, context.context)
+            resolved_inputs[name] = _resolve_string(value, context, ref_cache)
         else:
             resolved_inputs[name] = value
     step.inputs = resolved_inputs
     
     # Resolve output paths
     for output in step.outputs.values():
-        output.path = _resolve_string(output.path, context.context)
+        if output.has_variables:
+            output.path = _resolve_string(output.path, context, ref_cache)
+            output.has_variables = "${" in output.path
     
     return step
 
@@ -126,19 +235,18 @@ def resolve_variables(workflow: Workflow) -> Workflow:
         VariableResolutionError: If variable resolution fails
     """
     debug("Starting variable resolution for workflow: {}", workflow.name)
-    
-    # Create a copy to avoid modifying the original
-    workflow = deepcopy(workflow)
-    
-    # Create base context
-    context = VariableContext(workflow)
-    
-    # Resolve variables in steps
+
+    # Build the workflow-level context once; each step derives from it
+    # instead of rebuilding the shared config/workflow entries.
+    base_context = VariableContext(workflow)
+
+    # Resolve variables in steps; resolve_step_variables copies each step
+    # it touches, so only the steps mapping needs replacing on the clone.
+    # Config, inputs and metadata are read-only here and stay shared.
     resolved_steps = {}
     for name, step in workflow.steps.items():
-        step_context = VariableContext(workflow, step)
-        resolved_steps[name] = resolve_step_variables(step, step_context)
-    workflow.steps = resolved_steps
-    
+        resolved_steps[name] = resolve_step_variables(step, base_context.for_step(step))
+    workflow = replace(workflow, steps=resolved_steps)
+
     debug("Variable resolution completed")
     return workflow 
\ No newline at end of file
@@ -20,13 +20,18 @@ from .resource import validate_resources
 from .container import validate_containers
 from .dependency import validate_dependencies
 
+# Workflow and step names share one identifier grammar; compile it once
+# so both validators reuse the same pattern object.
+_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+$')
+
 def validate_workflow_basics(workflow: Workflow) -> None:
     """Validate basic workflow attributes."""
     debug("Validating workflow basics")
     if not workflow.name:
         error("Workflow name is required")
         raise ValidationError("Workflow name is required")
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', workflow.name):
+    if not _NAME_RE.match(workflow.name):
         error("Invalid workflow name: {}", workflow.name)
         raise ValidationError(
             "Workflow name must start with a letter and contain only letters, numbers, and underscores"
@@ -35,7 +40,7 @@ def validate_workflow_basics(workflow: Workflow) -> None:
     if not workflow.version:
         error("Workflow version is required")
         raise ValidationError("Workflow version is required")
-    if not re.match(r'^\d+\.\d+\.\d+$', workflow.version):
+    if not _VERSION_RE.match(workflow.version):
         error("Invalid version format: {}", workflow.version)
         raise ValidationError("Version must be in format X.Y.Z")
     
@@ -83,7 +88,7 @@ def validate_step(step: Step, available_steps: Set[str]) -> None:
     if not step.name:
         error("Step name is required")
         raise ValidationError("Step name is required")
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', step.name):
+    if not _NAME_RE.match(step.name):
         error("Invalid step name: {}", step.name)
         raise ValidationError(
             "Step name must start with a letter and contain only letters, numbers, and underscores"
@@ -11,6 +11,16 @@ from ..core.models import ContainerConfig
 from ..core.exceptions import ValidationError
 from ..utils.logging import debug, error
 
+# Compiled once at import; these run for every container of every workflow.
+# An image may carry a registry-with-port prefix (registry.io:5000/image),
+# which is the only place a colon is allowed
+_IMAGE_RE = re.compile(
+    r'^([a-z0-9]+([._-][a-z0-9]+)*:[0-9]+/)?'
+    r'[a-z0-9]+([._-][a-z0-9]+)*(/[a-z0-9]+([._-][a-z0-9]+)*)*$'
+)
+_TAG_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9._-]*$')
+_ENV_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
 def validate_containers(container: ContainerConfig) -> None:
     """
     Validate container configuration.
@@ -29,23 +39,18 @@ def validate_containers(container: ContainerConfig) -> None:
         raise ValidationError("Container image is required")
     
     # Docker image name validation best practice
-    if not re.match(r'^[a-z0-9]+([._-][a-z0-9]+)*(/[a-z0-9]+([._-][a-z0-9]+)*)*$', container.image):
+    if not _IMAGE_RE.match(container.image):
         error("Invalid image name format: {}", container.image)
         raise ValidationError(
             "Invalid image name format. Use lowercase letters, numbers, and separators (., _, -)"
         )
     
-    # Validate tag
-    if ":" in container.image:
-        error("Invalid image format: tag should be specified in tag field")
-        raise ValidationError("Tag should be specified in tag field, not in image string")
-    
     if not container.tag:
         error("Container tag is required")
         raise ValidationError("Container tag is required")
     
     # Basic tag validation
-    if not re.match(r'^[a-zA-Z0-9][a-zA-Z0-9._-]*$', container.tag):
+    if not _TAG_RE.match(container.tag):
         error("Invalid tag format: {}", container.tag)
         raise ValidationError(
             "Invalid tag format. Use letters, numbers, and separators (., _, -)"
@@ -72,7 +77,7 @@ def validate_containers(container: ContainerConfig) -> None:
     
     # Validate environment variables
     for key, value in container.env.items():
-        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', key):
+        if not _ENV_RE.match(key):
             error("Invalid environment variable name: {}", key)
             raise ValidationError(
                 f"Invalid environment variable name: {key}. "
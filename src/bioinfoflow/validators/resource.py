@@ -4,32 +4,27 @@ Resource validator for BioinfoFlow workflows.
 This module provides validation functionality for resource requirements.
 """
 
-import re
 from typing import Optional, Dict
 
 from ..core.models import ResourceRequirements
 from ..core.exceptions import ValidationError
 from ..utils.logging import debug, error
 
+# Byte multipliers for the supported size suffixes
+_SIZE_MULT = {'MB': 1 << 20, 'GB': 1 << 30, 'TB': 1 << 40}
+
 def _parse_size(size: str) -> Optional[int]:
-    """Parse size string to bytes."""
-    if not size:
+    """Parse a size string like "4GB" to bytes, or None if invalid."""
+    # A valid size is at least one digit plus a two-character suffix;
+    # a suffix lookup and digit check beat a regex match here
+    if not size or len(size) < 3:
         return None
     
-    match = re.match(r'^(\d+)([MGT]B)$', size)
-    if not match:
+    mult = _SIZE_MULT.get(size[-2:])
+    if mult is None or not size[:-2].isdigit():
         return None
     
-    value, unit = match.groups()
-    value = int(value)
-    
-    multipliers = {
-        'MB': 1024 * 1024,
-        'GB': 1024 * 1024 * 1024,
-        'TB': 1024 * 1024 * 1024 * 1024,
-    }
-    
-    return value * multipliers[unit]
+    return int(size[:-2]) * mult
 
 def validate_resources(resources: ResourceRequirements) -> None:
     """
@@ -49,7 +44,7 @@ def validate_resources(resources: ResourceRequirements) -> None:
         raise ValidationError("CPU count must be at least 1")
     
     # Validate memory format and value
-    if not re.match(r'^\d+[MGT]B$', resources.memory):
+    if _parse_size(resources.memory) is None:
         error("Invalid memory format: {}", resources.memory)
         raise ValidationError("Invalid memory format. Use format like '4GB', '512MB'")
     
@@ -60,7 +55,7 @@ def validate_resources(resources: ResourceRequirements) -> None:
     
     # Validate disk format if specified
     if resources.disk:
-        if not re.match(r'^\d+[MGT]B$', resources.disk):
+        if _parse_size(resources.disk) is None:
             error("Invalid disk format: {}", resources.disk)
             raise ValidationError("Invalid disk format. Use format like '10GB', '1TB'")
         